@@ -63,6 +63,7 @@ client_configs_to_display = ["autofill_import",
                              "mqtt_notifier",
                              "mqtt_commands",
                              "mqtt_events",
+                             "mqtt_events_batching",
                              "mqtt_external_events",
                              "mqtt_autostart",
                              "instance_id",
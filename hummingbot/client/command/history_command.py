@@ -63,7 +63,7 @@ class HistoryCommand:
                 int(start_time * 1e3),
                 session=session,
                 config_file_path=self.strategy_file_name)
-            return list([TradeFill.to_bounty_api_json(t) for t in trades])
+            return [TradeFill.to_bounty_api_json(t) for t in trades]
 
     async def history_report(self,  # type: HummingbotApplication
                              start_time: float,
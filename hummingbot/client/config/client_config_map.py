@@ -120,6 +120,14 @@ class MQTTBridgeConfigMap(BaseClientModel):
             ),
         ),
     )
+    mqtt_events_batching: bool = Field(
+        default=False,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Enable/Disable batching of forwarded events into a single MQTT message"
+            ),
+        ),
+    )
     mqtt_external_events: bool = Field(
         default=True,
         client_data=ClientFieldData(
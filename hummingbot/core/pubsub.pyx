@@ -15,7 +15,7 @@ from libcpp.vector cimport vector
 from enum import Enum
 import logging
 import random
-from typing import List
+from typing import List, Tuple
 
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.event.event_listener import EventListener
@@ -58,6 +58,10 @@ cdef class PubSub:
     def add_listener(self, event_tag: Enum, listener: EventListener):
         self.c_add_listener(event_tag.value, listener)
 
+    def add_listeners(self, event_pairs: List[Tuple[Enum, EventListener]]):
+        for event_tag, listener in event_pairs:
+            self.c_add_listener(event_tag.value, listener)
+
     def remove_listener(self, event_tag: Enum, listener: EventListener):
         self.c_remove_listener(event_tag.value, listener)
 
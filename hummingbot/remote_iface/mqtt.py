@@ -3,12 +3,14 @@
 import asyncio
 import functools
 import logging
+import queue
 import threading
 import time
 from collections import deque
-from dataclasses import asdict, is_dataclass
-from datetime import datetime
+from collections.abc import Mapping
+from dataclasses import fields, is_dataclass
 from decimal import Decimal
+from logging.handlers import QueueHandler, QueueListener
 from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
 
 from hummingbot import get_logging_conf
@@ -50,6 +52,50 @@ from hummingbot.remote_iface.messages import (
 
 mqtts_logger: HummingbotLogger = None
 
+_FORWARDED_MARKET_EVENTS: Tuple[events.MarketEvent, ...] = (
+    events.MarketEvent.BuyOrderCreated,
+    events.MarketEvent.BuyOrderCompleted,
+    events.MarketEvent.SellOrderCreated,
+    events.MarketEvent.SellOrderCompleted,
+    events.MarketEvent.OrderFilled,
+    events.MarketEvent.OrderFailure,
+    events.MarketEvent.OrderCancelled,
+    events.MarketEvent.OrderExpired,
+    events.MarketEvent.FundingPaymentCompleted,
+    events.MarketEvent.RangePositionLiquidityAdded,
+    events.MarketEvent.RangePositionLiquidityRemoved,
+    events.MarketEvent.RangePositionUpdate,
+    events.MarketEvent.RangePositionUpdateFailure,
+    events.MarketEvent.RangePositionFeeCollected,
+    events.MarketEvent.RangePositionClosed,
+)
+_EVENT_TYPE_NAMES: Dict[int, str] = {e.value: e.name for e in events.MarketEvent}
+
+# Field names of dataclass events, resolved once per event class.
+_FIELD_CACHE: Dict[type, Tuple[str, ...]] = {}
+
+
+def _dataclass_to_dict(obj) -> Dict[str, Any]:
+    # Same output as dataclasses.asdict(), without its deepcopy() of every
+    # leaf value. Nested dataclasses (e.g. trade fees) are still converted.
+    cls = type(obj)
+    names = _FIELD_CACHE.get(cls)
+    if names is None:
+        names = _FIELD_CACHE.setdefault(cls, tuple(f.name for f in fields(cls)))
+    return {name: _to_dict_value(getattr(obj, name)) for name in names}
+
+
+def _to_dict_value(value):
+    if is_dataclass(value) and not isinstance(value, type):
+        return _dataclass_to_dict(value)
+    elif isinstance(value, tuple) and hasattr(value, '_fields'):
+        return type(value)(*[_to_dict_value(v) for v in value])
+    elif isinstance(value, (list, tuple)):
+        return type(value)(_to_dict_value(v) for v in value)
+    elif isinstance(value, dict):
+        return type(value)((_to_dict_value(k), _to_dict_value(v)) for k, v in value.items())
+    return value
+
 
 class CommandTopicSpecs:
     START: str = '/start'
@@ -87,68 +133,26 @@ class MQTTCommands:
         self.logger = self._hb_app.logger
         self._ev_loop: asyncio.AbstractEventLoop = self._hb_app.ev_loop
 
-        topic_prefix = TopicSpecs.PREFIX.format(
-            namespace=self._node.namespace,
-            instance_id=self._hb_app.instance_id
-        )
-        self._start_uri = f'{topic_prefix}{TopicSpecs.COMMANDS.START}'
-        self._stop_uri = f'{topic_prefix}{TopicSpecs.COMMANDS.STOP}'
-        self._config_uri = f'{topic_prefix}{TopicSpecs.COMMANDS.CONFIG}'
-        self._import_uri = f'{topic_prefix}{TopicSpecs.COMMANDS.IMPORT}'
-        self._status_uri = f'{topic_prefix}{TopicSpecs.COMMANDS.STATUS}'
-        self._history_uri = f'{topic_prefix}{TopicSpecs.COMMANDS.HISTORY}'
-        self._balance_limit_uri = f'{topic_prefix}{TopicSpecs.COMMANDS.BALANCE_LIMIT}'
-        self._balance_paper_uri = f'{topic_prefix}{TopicSpecs.COMMANDS.BALANCE_PAPER}'
-        self._shortcuts_uri = f'{topic_prefix}{TopicSpecs.COMMANDS.COMMAND_SHORTCUT}'
-
         self._init_commands()
 
     def _init_commands(self):
-        self._node.create_rpc(
-            rpc_name=self._start_uri,
-            msg_type=StartCommandMessage,
-            on_request=self._on_cmd_start
-        )
-        self._node.create_rpc(
-            rpc_name=self._stop_uri,
-            msg_type=StopCommandMessage,
-            on_request=self._on_cmd_stop
-        )
-        self._node.create_rpc(
-            rpc_name=self._config_uri,
-            msg_type=ConfigCommandMessage,
-            on_request=self._on_cmd_config
-        )
-        self._node.create_rpc(
-            rpc_name=self._import_uri,
-            msg_type=ImportCommandMessage,
-            on_request=self._on_cmd_import
-        )
-        self._node.create_rpc(
-            rpc_name=self._status_uri,
-            msg_type=StatusCommandMessage,
-            on_request=self._on_cmd_status
-        )
-        self._node.create_rpc(
-            rpc_name=self._history_uri,
-            msg_type=HistoryCommandMessage,
-            on_request=self._on_cmd_history
-        )
-        self._node.create_rpc(
-            rpc_name=self._balance_limit_uri,
-            msg_type=BalanceLimitCommandMessage,
-            on_request=self._on_cmd_balance_limit
-        )
-        self._node.create_rpc(
-            rpc_name=self._balance_paper_uri,
-            msg_type=BalancePaperCommandMessage,
-            on_request=self._on_cmd_balance_paper
-        )
-        self._node.create_rpc(
-            rpc_name=self._shortcuts_uri,
-            msg_type=CommandShortcutMessage,
-            on_request=self._on_cmd_command_shortcut
+        commands = (
+            (TopicSpecs.COMMANDS.START, StartCommandMessage, self._on_cmd_start),
+            (TopicSpecs.COMMANDS.STOP, StopCommandMessage, self._on_cmd_stop),
+            (TopicSpecs.COMMANDS.CONFIG, ConfigCommandMessage, self._on_cmd_config),
+            (TopicSpecs.COMMANDS.IMPORT, ImportCommandMessage, self._on_cmd_import),
+            (TopicSpecs.COMMANDS.STATUS, StatusCommandMessage, self._on_cmd_status),
+            (TopicSpecs.COMMANDS.HISTORY, HistoryCommandMessage, self._on_cmd_history),
+            (TopicSpecs.COMMANDS.BALANCE_LIMIT, BalanceLimitCommandMessage, self._on_cmd_balance_limit),
+            (TopicSpecs.COMMANDS.BALANCE_PAPER, BalancePaperCommandMessage, self._on_cmd_balance_paper),
+            (TopicSpecs.COMMANDS.COMMAND_SHORTCUT, CommandShortcutMessage, self._on_cmd_command_shortcut),
         )
+        for topic, msg_type, on_request in commands:
+            self._node.create_rpc(
+                rpc_name=f'{self._node.topic_prefix}{topic}',
+                msg_type=msg_type,
+                on_request=on_request
+            )
 
     def _on_cmd_start(self, msg: StartCommandMessage.Request):
         response = StartCommandMessage.Response()
@@ -215,8 +219,9 @@ class MQTTCommands:
                 self._hb_app.config()
             else:
                 invalid_params = []
+                configurable_keys = set(self._hb_app.configurable_keys())
                 for param in msg.params:
-                    if param[0] in self._hb_app.configurable_keys():
+                    if param[0] in configurable_keys:
                         self._ev_loop.call_soon_threadsafe(
                             self._hb_app.config,
                             param[0],
@@ -361,6 +366,9 @@ class MQTTCommands:
 
 
 class MQTTMarketEventForwarder:
+    _EVENT_BATCH_SIZE = 64
+    _EVENT_BATCH_INTERVAL = 0.02  # seconds
+
     @classmethod
     def logger(cls) -> HummingbotLogger:
         global mqtts_logger
@@ -380,32 +388,20 @@ class MQTTMarketEventForwarder:
         self._ev_loop: asyncio.AbstractEventLoop = self._hb_app.ev_loop
         self._markets: List[ConnectorBase] = list(self._hb_app.markets.values())
 
-        topic_prefix = TopicSpecs.PREFIX.format(
-            namespace=self._node.namespace,
-            instance_id=self._hb_app.instance_id
-        )
-        self._topic = f'{topic_prefix}{TopicSpecs.INTERNAL_EVENTS}'
+        self._topic = f'{self._node.topic_prefix}{TopicSpecs.INTERNAL_EVENTS}'
 
         self._mqtt_fowarder: SourceInfoEventForwarder = \
             SourceInfoEventForwarder(self._send_mqtt_event)
-        self._market_event_pairs: List[Tuple[int, EventListener]] = [
-            (events.MarketEvent.BuyOrderCreated, self._mqtt_fowarder),
-            (events.MarketEvent.BuyOrderCompleted, self._mqtt_fowarder),
-            (events.MarketEvent.SellOrderCreated, self._mqtt_fowarder),
-            (events.MarketEvent.SellOrderCompleted, self._mqtt_fowarder),
-            (events.MarketEvent.OrderFilled, self._mqtt_fowarder),
-            (events.MarketEvent.OrderFailure, self._mqtt_fowarder),
-            (events.MarketEvent.OrderCancelled, self._mqtt_fowarder),
-            (events.MarketEvent.OrderExpired, self._mqtt_fowarder),
-            (events.MarketEvent.FundingPaymentCompleted, self._mqtt_fowarder),
-            (events.MarketEvent.RangePositionLiquidityAdded, self._mqtt_fowarder),
-            (events.MarketEvent.RangePositionLiquidityRemoved, self._mqtt_fowarder),
-            (events.MarketEvent.RangePositionUpdate, self._mqtt_fowarder),
-            (events.MarketEvent.RangePositionUpdateFailure, self._mqtt_fowarder),
-            (events.MarketEvent.RangePositionFeeCollected, self._mqtt_fowarder),
-            (events.MarketEvent.RangePositionClosed, self._mqtt_fowarder),
+        self._market_event_pairs: List[Tuple[events.MarketEvent, EventListener]] = [
+            (event_tag, self._mqtt_fowarder) for event_tag in _FORWARDED_MARKET_EVENTS
         ]
 
+        self._batching: bool = self._hb_app.client_config_map.mqtt_bridge.mqtt_events_batching
+        self._batch: List[Dict[str, Any]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._pending_events: deque = deque()
+        self._draining: bool = False
+
         self.event_fw_pub = self._node.create_publisher(
             topic=self._topic, msg_type=InternalEventMessage
         )
@@ -413,60 +409,90 @@ class MQTTMarketEventForwarder:
 
     def _send_mqtt_event(self, event_tag: int, pubsub: PubSub, event):
         if threading.current_thread() != threading.main_thread():  # pragma: no cover
-            self._ev_loop.call_soon_threadsafe(
-                self._send_mqtt_event,
-                event_tag,
-                pubsub,
-                event
-            )
+            # Wake up the event loop once per burst of events, not per event
+            self._pending_events.append((event_tag, pubsub, event))
+            if not self._draining:
+                self._draining = True
+                self._ev_loop.call_soon_threadsafe(self._drain_pending_events)
             return
-        try:
-            event_types = {
-                events.MarketEvent.BuyOrderCreated.value: "BuyOrderCreated",
-                events.MarketEvent.BuyOrderCompleted.value: "BuyOrderCompleted",
-                events.MarketEvent.SellOrderCreated.value: "SellOrderCreated",
-                events.MarketEvent.SellOrderCompleted.value: "SellOrderCompleted",
-                events.MarketEvent.OrderFilled.value: "OrderFilled",
-                events.MarketEvent.OrderCancelled.value: "OrderCancelled",
-                events.MarketEvent.OrderExpired.value: "OrderExpired",
-                events.MarketEvent.OrderFailure.value: "OrderFailure",
-                events.MarketEvent.FundingPaymentCompleted.value: "FundingPaymentCompleted",
-                events.MarketEvent.RangePositionLiquidityAdded.value: "RangePositionLiquidityAdded",
-                events.MarketEvent.RangePositionLiquidityRemoved.value: "RangePositionLiquidityRemoved",
-                events.MarketEvent.RangePositionUpdate.value: "RangePositionUpdate",
-                events.MarketEvent.RangePositionUpdateFailure.value: "RangePositionUpdateFailure",
-                events.MarketEvent.RangePositionFeeCollected.value: "RangePositionFeeCollected",
-                events.MarketEvent.RangePositionClosed.value: "RangePositionClosed",
-            }
-            event_type = event_types[event_tag]
-        except KeyError:
-            event_type = "Unknown"
+        event_type = _EVENT_TYPE_NAMES.get(event_tag, "Unknown")
 
         if is_dataclass(event):
-            event_data = asdict(event)
+            event_data = _dataclass_to_dict(event)
         elif isinstance(event, tuple) and hasattr(event, '_fields'):
             event_data = event._asdict()
+        elif isinstance(event, Mapping):
+            event_data = dict(event)
+        elif hasattr(event, '__dict__'):
+            event_data = vars(event).copy()
         else:
-            try:
-                event_data = dict(event)
-            except (TypeError, ValueError):
-                event_data = {}
+            event_data = {}
 
-        try:
-            timestamp = event_data.pop('timestamp')
-        except KeyError:
-            timestamp = datetime.now().timestamp()
+        timestamp = event_data.pop('timestamp', None)
+        if timestamp is None:
+            timestamp = time.time()
 
         event_data = self._make_event_payload(event_data)
 
+        if self._batching:
+            self._add_to_batch(int(timestamp), event_type, event_data)
+            return
+
         self.event_fw_pub.publish(
-            InternalEventMessage(
+            InternalEventMessage.construct(
                 timestamp=int(timestamp),
                 type=event_type,
                 data=event_data
             )
         )
 
+    def _drain_pending_events(self):
+        self._draining = False
+        while len(self._pending_events) > 0:
+            event_tag, pubsub, event = self._pending_events.popleft()
+            try:
+                self._send_mqtt_event(event_tag, pubsub, event)
+            except Exception:
+                self.logger().error(
+                    f'Failed to forward event {event_tag} to MQTT.',
+                    exc_info=True
+                )
+
+    def _add_to_batch(self, timestamp: int, event_type: str, event_data: Dict[str, Any]):
+        self._batch.append({
+            'timestamp': timestamp,
+            'type': event_type,
+            'data': event_data
+        })
+        if len(self._batch) >= self._EVENT_BATCH_SIZE:
+            self._flush_batch()
+        elif self._flush_handle is None:
+            self._flush_handle = self._ev_loop.call_later(
+                self._EVENT_BATCH_INTERVAL,
+                self._flush_batch
+            )
+
+    def _flush_batch(self):
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if len(self._batch) == 0:
+            return
+        batch, self._batch = self._batch, []
+        try:
+            self.event_fw_pub.publish(
+                InternalEventMessage.construct(
+                    timestamp=batch[-1]['timestamp'],
+                    type='Batch',
+                    data={'events': batch}
+                )
+            )
+        except Exception:
+            self.logger().error(
+                f'Dropped {len(batch)} batched event(s) that could not be published.',
+                exc_info=True
+            )
+
     def _make_event_payload(self, event_data):
         if 'type' in event_data:
             event_data['type'] = str(event_data['type'])
@@ -490,19 +516,22 @@ class MQTTMarketEventForwarder:
 
     def _start_event_listeners(self):
         for market in self._markets:
-            for event_pair in self._market_event_pairs:
-                market.add_listener(event_pair[0], event_pair[1])
-                self.logger().debug(
-                    f'Created MQTT bridge for event: {event_pair[0]}, {event_pair[1]}'
-                )
+            market.add_listeners(self._market_event_pairs)
+        self.logger().debug(
+            f'Created MQTT bridge for {len(self._market_event_pairs)} events '
+            f'on {len(self._markets)} market(s)'
+        )
 
     def _stop_event_listeners(self):
         for market in self._markets:
             for event_pair in self._market_event_pairs:
                 market.remove_listener(event_pair[0], event_pair[1])
+        self._flush_batch()
 
 
 class MQTTNotifier(NotifierBase):
+    _DUPLICATE_MSG_WINDOW = 0.1  # seconds
+
     def __init__(self,
                  hb_app: "HummingbotApplication",
                  node: Node) -> None:
@@ -511,21 +540,31 @@ class MQTTNotifier(NotifierBase):
         self._hb_app = hb_app
         self._ev_loop: asyncio.AbstractEventLoop = self._hb_app.ev_loop
 
-        topic_prefix = TopicSpecs.PREFIX.format(
-            namespace=self._node.namespace,
-            instance_id=self._hb_app.instance_id
-        )
-        self._topic = f'{topic_prefix}{TopicSpecs.NOTIFICATIONS}'
+        self._topic = f'{self._node.topic_prefix}{TopicSpecs.NOTIFICATIONS}'
         self.notify_pub = self._node.create_publisher(
             topic=self._topic,
             msg_type=NotifyMessage
         )
+        self._last_msg: Optional[str] = None
+        self._last_msg_ts: float = 0.0
 
     def add_msg_to_queue(self, msg: str):
         if threading.current_thread() != threading.main_thread():  # pragma: no cover
             self._ev_loop.call_soon_threadsafe(self.add_msg_to_queue, msg)
             return
-        self.notify_pub.publish(NotifyMessage(msg=msg))
+        if self._is_duplicate(msg):
+            return
+        self.notify_pub.publish(NotifyMessage.construct(msg=msg))
+
+    def _is_duplicate(self, msg: str) -> bool:
+        # Only back-to-back repeats are dropped; the notify topic mirrors the
+        # console output, where the same line legitimately recurs between others.
+        now = time.monotonic()
+        if msg == self._last_msg and now - self._last_msg_ts < self._DUPLICATE_MSG_WINDOW:
+            return True
+        self._last_msg = msg
+        self._last_msg_ts = now
+        return False
 
     def start(self) -> None:
         return None
@@ -542,11 +581,7 @@ class MQTTStatusUpdates:
         self._hb_app = hb_app
         self._ev_loop: asyncio.AbstractEventLoop = self._hb_app.ev_loop
 
-        topic_prefix = TopicSpecs.PREFIX.format(
-            namespace=self._node.namespace,
-            instance_id=self._hb_app.instance_id
-        )
-        self._topic = f'{topic_prefix}{TopicSpecs.STATUS_UPDATES}'
+        self._topic = f'{self._node.topic_prefix}{TopicSpecs.STATUS_UPDATES}'
         self.status_updates_pub = self._node.create_publisher(
             topic=self._topic,
             msg_type=StatusUpdateMessage
@@ -603,6 +638,8 @@ class MQTTGateway(Node):
         self._market_events: MQTTMarketEventForwarder = None
         self._commands: MQTTCommands = None
         self._logh: MQTTLogHandler = None
+        self._log_queue_handler: MQTTLogQueueHandler = None
+        self._log_listener: QueueListener = None
         self._external_events: MQTTExternalEvents = None
         self._hb_app: "HummingbotApplication" = hb_app
         self._ev_loop = self._hb_app.ev_loop
@@ -631,6 +668,10 @@ class MQTTGateway(Node):
     def health(self):
         return self._health
 
+    @property
+    def topic_prefix(self) -> str:
+        return self._topic_prefix
+
     def _safe_get_log_handlers(self, max_tries=3):  # pragma: no cover
         current_try = 0
         while current_try < max_tries:
@@ -646,22 +687,34 @@ class MQTTGateway(Node):
         loggers = self._safe_get_log_handlers()
         log_conf = get_logging_conf()
 
-        if 'loggers' not in log_conf:
-            return
-
-        logs = [key for key, val in log_conf.get('loggers').items()]
-        for logger in loggers:
-            if 'hummingbot' in logger.name:
-                for log in logs:
-                    if log in logger.name:
-                        self.remove_log_handler(logger)
+        self.remove_log_handler(self._get_root_logger())
+        if 'loggers' in log_conf:
+            logs = [key for key, val in log_conf.get('loggers').items()]
+            for logger in loggers:
+                if 'hummingbot' in logger.name:
+                    for log in logs:
+                        if log in logger.name:
+                            self.remove_log_handler(logger)
 
+        self._stop_log_listener()
         self._logh = None
 
     def _init_logger(self):
+        # Loggers only enqueue records; formatting and publishing to the
+        # broker happen on the QueueListener thread.
         self._logh = MQTTLogHandler(self._hb_app, self)
+        log_queue = queue.SimpleQueue()
+        self._log_queue_handler = MQTTLogQueueHandler(log_queue)
+        self._log_listener = QueueListener(log_queue, self._logh, respect_handler_level=True)
+        self._log_listener.start()
         self.patch_loggers()
 
+    def _stop_log_listener(self):
+        if self._log_listener is not None:
+            self._log_listener.stop()
+            self._log_listener = None
+        self._log_queue_handler = None
+
     def patch_loggers(self):  # pragma: no cover
         loggers = self._safe_get_log_handlers()
 
@@ -688,10 +741,10 @@ class MQTTGateway(Node):
         return logging.getLogger()
 
     def remove_log_handler(self, logger: HummingbotLogger):
-        logger.removeHandler(self._logh)
+        logger.removeHandler(self._log_queue_handler)
 
     def add_log_handler(self, logger: HummingbotLogger):
-        logger.addHandler(self._logh)
+        logger.addHandler(self._log_queue_handler)
 
     def _init_notifier(self):
         if self._hb_app.client_config_map.mqtt_bridge.mqtt_notifier:
@@ -856,13 +909,16 @@ class MQTTGateway(Node):
 
     def stop(self, with_health: bool = True):
         self.broadcast_status_update("offline", msg_type="availability")
+        # Removing the market event listeners flushes batched events and
+        # stopping the log listener drains the queued records, so both must
+        # happen while the publishers are still connected.
+        self._remove_market_event_listeners()
+        self._remove_log_handlers()
         super().stop()
         if self._hb_thread:
             self._hb_thread.stop()
         self._remove_status_updates()
         self._remove_notifier()
-        self._remove_log_handlers()
-        self._remove_market_event_listeners()
 
         if with_health:
             self._stop_health_monitoring_loop()
@@ -883,11 +939,7 @@ class MQTTLogHandler(logging.Handler):
         self._node = node
         self._ev_loop: asyncio.AbstractEventLoop = self._hb_app.ev_loop
 
-        topic_prefix = TopicSpecs.PREFIX.format(
-            namespace=self._node.namespace,
-            instance_id=self._hb_app.instance_id
-        )
-        self._topic = f'{topic_prefix}{TopicSpecs.LOGS}'
+        self._topic = f'{self._node.topic_prefix}{TopicSpecs.LOGS}'
 
         super().__init__()
         self.name = self.__class__.__name__
@@ -895,19 +947,24 @@ class MQTTLogHandler(logging.Handler):
                                                    msg_type=LogMessage)
 
     def emit(self, record: logging.LogRecord):
-        if threading.current_thread() != threading.main_thread():  # pragma: no cover
-            self._ev_loop.call_soon_threadsafe(self.emit, record)
-            return
-        msg_str = self.format(record)
-        msg = LogMessage(
-            timestamp=time.time(),
-            msg=msg_str,
-            level_no=record.levelno,
-            level_name=record.levelname,
-            logger_name=record.name
+        try:
+            msg = LogMessage.construct(
+                timestamp=record.created,
+                msg=self.format(record),
+                level_no=record.levelno,
+                level_name=record.levelname,
+                logger_name=record.name
+            )
+            self.log_pub.publish(msg)
+        except Exception:
+            self.handleError(record)
 
-        )
-        self.log_pub.publish(msg)
+
+class MQTTLogQueueHandler(QueueHandler):
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # The queue never leaves the process, so the record is passed as is
+        # and formatted by MQTTLogHandler on the listener thread.
+        return record
 
 
 class MQTTExternalEvents:
@@ -919,11 +976,7 @@ class MQTTExternalEvents:
         self._hb_app: 'HummingbotApplication' = hb_app
         self._ev_loop: asyncio.AbstractEventLoop = self._hb_app.ev_loop
 
-        topic_prefix = TopicSpecs.PREFIX.format(
-            namespace=self._node.namespace,
-            instance_id=self._hb_app.instance_id
-        )
-        self._topic = f'{topic_prefix}{TopicSpecs.EXTERNAL_EVENTS}'
+        self._topic = f'{self._node.topic_prefix}{TopicSpecs.EXTERNAL_EVENTS}'
 
         self._node.create_psubscriber(
             topic=self._topic,
@@ -999,12 +1052,8 @@ class ETopicListener:
         self._node = MQTTGateway.main()
         if self._node is None:
             raise Exception('MQTT Gateway not yet initialized')
-        topic_prefix = TopicSpecs.PREFIX.format(
-            namespace=self._node.namespace,
-            instance_id=self._node._hb_app.instance_id
-        )
         if use_bot_prefix:
-            self._topic = f'{topic_prefix}/{topic}'
+            self._topic = f'{self._node.topic_prefix}/{topic}'
         else:
             self._topic = topic
         self._on_message = on_message
@@ -1151,10 +1200,7 @@ class ETopicPublisher:
         self._node = MQTTGateway.main()
         if self._node is None:
             raise Exception('MQTT Gateway not yet initialized')
-        self._topic_prefix = TopicSpecs.PREFIX.format(
-            namespace=self._node.namespace,
-            instance_id=self._node._hb_app.instance_id
-        )
+        self._topic_prefix = self._node.topic_prefix
         if use_bot_prefix:
             self._topic = f'{self._topic_prefix}/{topic}'
         else:
@@ -1180,10 +1226,7 @@ class EMTopicPublisher:
         self._node = MQTTGateway.main()
         if self._node is None:
             raise Exception('MQTT Gateway not yet initialized')
-        self._topic_prefix = TopicSpecs.PREFIX.format(
-            namespace=self._node.namespace,
-            instance_id=self._node._hb_app.instance_id
-        )
+        self._topic_prefix = self._node.topic_prefix
 
         self._pub = self._node.create_mpublisher()
         if self._node.state == NodeState.RUNNING:
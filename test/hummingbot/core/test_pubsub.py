@@ -33,6 +33,19 @@ class PubSubTest(unittest.TestCase):
         self.assertIn(self.listener_zero, listeners)
         self.assertIn(self.listener_one, listeners)
 
+    def test_add_listeners_in_bulk(self):
+        self.pubsub.add_listeners([
+            (self.event_tag_zero, self.listener_zero),
+            (self.event_tag_one, self.listener_zero),
+            (self.event_tag_one, self.listener_one),
+        ])
+        listeners_zero = self.pubsub.get_listeners(self.event_tag_zero)
+        listeners_one = self.pubsub.get_listeners(self.event_tag_one)
+        self.assertEqual([self.listener_zero], listeners_zero)
+        self.assertEqual(2, len(listeners_one))
+        self.assertIn(self.listener_zero, listeners_one)
+        self.assertIn(self.listener_one, listeners_one)
+
     def test_add_listener_twice(self):
         self.pubsub.add_listener(self.event_tag_zero, self.listener_zero)
         listeners_count = len(self.pubsub.get_listeners(self.event_tag_zero))
@@ -966,6 +966,51 @@ class RemoteIfaceMQTTTests(TestCase):
         self.async_run_with_timeout(self.wait_for_rcv(events_topic, evt_type, msg_key = 'type'), timeout=10)
         self.assertTrue(self.is_msg_received(events_topic, evt_type, msg_key = 'type'))
 
+    def test_mqtt_event_batching(self):
+        self.client_config_map.mqtt_bridge.mqtt_events_batching = True
+        self.start_mqtt()
+
+        self.emit_order_expired_event(self.test_market)
+        self.emit_order_expired_event(self.test_market)
+
+        events_topic = f"hbot/{self.instance_id}/events"
+
+        evt_type = "Batch"
+        self.async_run_with_timeout(self.wait_for_rcv(events_topic, evt_type, msg_key = 'type'), timeout=10)
+        self.assertTrue(self.is_msg_received(events_topic, evt_type, msg_key = 'type'))
+        self.assertFalse(self.is_msg_received(events_topic, "OrderExpired", msg_key = 'type'))
+        self.assertEqual(0, len(self.gateway._market_events._batch))
+
+    def test_mqtt_event_batching_flushed_on_stop(self):
+        self.client_config_map.mqtt_bridge.mqtt_events_batching = True
+        self.start_mqtt()
+
+        market_events = self.gateway._market_events
+        self.emit_order_expired_event(self.test_market)
+        self.assertEqual(1, len(market_events._batch))
+        with patch("commlib.node.Node.stop") as node_stop_mock:
+            node_stop_mock.side_effect = lambda: self.assertEqual(0, len(market_events._batch))
+            self.gateway.stop()
+            node_stop_mock.assert_called_once()
+
+        events_topic = f"hbot/{self.instance_id}/events"
+        self.assertTrue(self.is_msg_received(events_topic, "Batch", msg_key = 'type'))
+        self.assertNotIn(market_events._mqtt_fowarder, self.test_market.get_listeners(MarketEvent.OrderExpired))
+        self.assertEqual(0, len(self.gateway._market_events._batch))
+        self.assertIsNone(self.gateway._market_events._flush_handle)
+
+    def test_mqtt_event_batching_drop_logged_when_publish_fails(self):
+        self.client_config_map.mqtt_bridge.mqtt_events_batching = True
+        self.start_mqtt()
+
+        market_events = self.gateway._market_events
+        self.emit_order_expired_event(self.test_market)
+        market_events.event_fw_pub.publish = MagicMock(side_effect=RuntimeError(self.fake_err_msg))
+        market_events._flush_batch()
+
+        self.assertEqual(0, len(market_events._batch))
+        self.assertTrue(self._is_logged("ERROR", "Dropped 1 batched event(s) that could not be published."))
+
     def test_mqtt_subscribed_topics(self):
         self.start_mqtt()
         self.assertTrue(self.gateway is not None)
@@ -992,6 +1037,33 @@ class RemoteIfaceMQTTTests(TestCase):
         self.assertTrue(self.is_msg_received(events_topic, evt_type, msg_key = 'type'))
         self.assertTrue(self.is_msg_received(events_topic, test_evt, msg_key = 'data'))
 
+    def test_mqtt_eventforwarder_drain_pending_events(self):
+        self.start_mqtt()
+        market_events = self.gateway._market_events
+        market_events._pending_events.append((999, None, {"first": 1}))
+        market_events._pending_events.append((999, None, {"second": 2}))
+        market_events._draining = True
+        market_events._drain_pending_events()
+
+        events_topic = f"hbot/{self.instance_id}/events"
+        self.assertFalse(market_events._draining)
+        self.assertEqual(0, len(market_events._pending_events))
+        self.assertTrue(self.is_msg_received(events_topic, {"first": 1}, msg_key = 'data'))
+        self.assertTrue(self.is_msg_received(events_topic, {"second": 2}, msg_key = 'data'))
+
+    def test_mqtt_eventforwarder_drain_continues_after_failed_event(self):
+        self.start_mqtt()
+        market_events = self.gateway._market_events
+        market_events._pending_events.append((999, None, {"timestamp": "not a number"}))
+        market_events._pending_events.append((999, None, {"second": 2}))
+        market_events._draining = True
+        market_events._drain_pending_events()
+
+        events_topic = f"hbot/{self.instance_id}/events"
+        self.assertEqual(0, len(market_events._pending_events))
+        self.assertTrue(self.is_msg_received(events_topic, {"second": 2}, msg_key = 'data'))
+        self.assertTrue(self._is_logged("ERROR", "Failed to forward event 999 to MQTT."))
+
     def test_mqtt_eventforwarder_invalid_events(self):
         self.start_mqtt()
         self.gateway._market_events._send_mqtt_event(event_tag=999,
@@ -1006,11 +1078,49 @@ class RemoteIfaceMQTTTests(TestCase):
         self.assertTrue(self.is_msg_received(events_topic, evt_type, msg_key = 'type'))
         self.assertTrue(self.is_msg_received(events_topic, {}, msg_key = 'data'))
 
+    def test_mqtt_eventforwarder_plain_object_events(self):
+        class PlainEvent:
+            def __init__(self):
+                self.order_id = "OID1"
+
+        self.start_mqtt()
+        self.gateway._market_events._send_mqtt_event(event_tag=999,
+                                                     pubsub=None,
+                                                     event=PlainEvent())
+
+        events_topic = f"hbot/{self.instance_id}/events"
+        self.assertTrue(self.is_msg_received(events_topic, {"order_id": "OID1"}, msg_key = 'data'))
+
     def test_mqtt_notifier_fakes(self):
         self.start_mqtt()
         self.assertEqual(self.gateway._notifier.start(), None)
         self.assertEqual(self.gateway._notifier.stop(), None)
 
+    def test_mqtt_notifier_drops_duplicate_msgs(self):
+        self.start_mqtt()
+        notify_topic = f"hbot/{self.instance_id}/notify"
+        self.gateway._notifier.add_msg_to_queue("duplicate")
+        self.gateway._notifier.add_msg_to_queue("duplicate")
+        self.gateway._notifier.add_msg_to_queue("other")
+        sent_msgs = [m['msg'] for m in self.fake_mqtt_broker.received_msgs[notify_topic]]
+        self.assertEqual(1, sent_msgs.count("duplicate"))
+        self.assertEqual(1, sent_msgs.count("other"))
+
+        self.gateway._notifier.add_msg_to_queue("duplicate")
+        sent_msgs = [m['msg'] for m in self.fake_mqtt_broker.received_msgs[notify_topic]]
+        self.assertEqual(2, sent_msgs.count("duplicate"))
+
+    def test_mqtt_notifier_keeps_repeated_msgs_separated_by_others(self):
+        self.start_mqtt()
+        notify_topic = f"hbot/{self.instance_id}/notify"
+        for exchange in ("binance", "kucoin"):
+            self.gateway._notifier.add_msg_to_queue(f"\n{exchange}")
+            self.gateway._notifier.add_msg_to_queue("You have no limits on this exchange.")
+        sent_msgs = [m['msg'] for m in self.fake_mqtt_broker.received_msgs[notify_topic]]
+        self.assertEqual(2, sent_msgs.count("You have no limits on this exchange."))
+        self.assertEqual(["\nbinance", "You have no limits on this exchange.",
+                          "\nkucoin", "You have no limits on this exchange."], sent_msgs[-4:])
+
     def test_mqtt_gateway_check_health(self):
         tmp = self.gateway._start_health_monitoring_loop
         self.gateway._start_health_monitoring_loop = lambda: None
@@ -1159,11 +1269,59 @@ class RemoteIfaceMQTTTests(TestCase):
 
         logger = HummingbotLogger('testlogger')
         self.gateway.add_log_handler(logger)
+        logger.error('queued log message')
+        log_topic = f"hbot/{self.instance_id}/log"
+        self.async_run_with_timeout(self.wait_for_rcv(log_topic, 'queued log message'), timeout=10)
+        self.assertTrue(self.is_msg_received(log_topic, 'queued log message'))
         self.gateway.remove_log_handler(logger)
         logger = self.gateway._get_root_logger()
         self.assertTrue(logger is not None)
         self.gateway._remove_log_handlers()
 
+    def test_mqtt_log_handler_survives_publish_error(self):
+        import logging
+
+        from hummingbot.logger import HummingbotLogger
+        self.start_mqtt()
+
+        log_pub = self.gateway._logh.log_pub
+        original_publish = log_pub.publish
+
+        def publish(msg):
+            if msg.msg == 'failing log message':
+                raise RuntimeError(self.fake_err_msg)
+            original_publish(msg)
+
+        log_pub.publish = MagicMock(side_effect=publish)
+        logger = HummingbotLogger('testlogger')
+        self.gateway.add_log_handler(logger)
+        log_topic = f"hbot/{self.instance_id}/log"
+        with patch.object(logging, "raiseExceptions", False):
+            logger.error('failing log message')
+            logger.error('next log message')
+            self.async_run_with_timeout(self.wait_for_rcv(log_topic, 'next log message'), timeout=10)
+        self.assertTrue(self.is_msg_received(log_topic, 'next log message'))
+        self.assertFalse(self.is_msg_received(log_topic, 'failing log message'))
+        self.assertEqual(2, log_pub.publish.call_count)
+        self.assertTrue(self.gateway._log_listener._thread.is_alive())
+        self.gateway.remove_log_handler(logger)
+
+    def test_mqtt_log_handler_drained_before_stop(self):
+        from hummingbot.logger import HummingbotLogger
+        self.start_mqtt()
+
+        log_listener = self.gateway._log_listener
+        logger = HummingbotLogger('testlogger')
+        self.gateway.add_log_handler(logger)
+        with patch("commlib.node.Node.stop") as node_stop_mock:
+            node_stop_mock.side_effect = lambda: self.assertIsNone(log_listener._thread)
+            logger.error('last log message')
+            self.gateway.stop()
+            node_stop_mock.assert_called_once()
+        log_topic = f"hbot/{self.instance_id}/log"
+        self.assertTrue(self.is_msg_received(log_topic, 'last log message'))
+        self.gateway.remove_log_handler(logger)
+
     def test_market_events(self):
         self.start_mqtt()
         from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, DeductedFromReturnsTradeFee
@@ -1183,6 +1341,36 @@ class RemoteIfaceMQTTTests(TestCase):
         })
         self.assertTrue(1)
 
+    def test_dataclass_to_dict(self):
+        from hummingbot.remote_iface.mqtt import _FIELD_CACHE, _dataclass_to_dict
+
+        event = BuyOrderCreatedEvent(
+            1671819499, OrderType.LIMIT, "HBOT-USDT", Decimal("1.5"), Decimal("100"), "HBOT_1", 1671819499
+        )
+        event_data = _dataclass_to_dict(event)
+        self.assertEqual("HBOT_1", event_data["order_id"])
+        self.assertEqual(Decimal("1.5"), event_data["amount"])
+        self.assertIn(BuyOrderCreatedEvent, _FIELD_CACHE)
+        self.assertEqual(tuple(event_data.keys()), _FIELD_CACHE[BuyOrderCreatedEvent])
+
+    def test_dataclass_to_dict_nested_trade_fee(self):
+        from dataclasses import asdict
+
+        from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, TokenAmount
+        from hummingbot.core.event.events import RangePositionLiquidityAddedEvent
+        from hummingbot.remote_iface.mqtt import _dataclass_to_dict
+
+        event = RangePositionLiquidityAddedEvent(
+            1671819499, "OID1", "EOID1", "HBOT-USDT", Decimal("90"), Decimal("110"), Decimal("1.5"), "LOW",
+            1671819499, AddedToCostTradeFee(percent=Decimal("0.01"), flat_fees=[TokenAmount("HBOT", Decimal("2"))])
+        )
+        event_data = _dataclass_to_dict(event)
+        self.assertEqual(asdict(event), event_data)
+        self.assertEqual(
+            {'percent': Decimal("0.01"), 'percent_token': None, 'flat_fees': [{'token': "HBOT", 'amount': Decimal("2")}]},
+            event_data['trade_fee']
+        )
+
     def test_etopic_listener_class(self):
         from hummingbot.remote_iface.mqtt import ETopicListener
 